@@ -19,6 +19,10 @@ To mitigate this, the script:
 3) Cleans the first table by removing any rows that contain header-like
    keys so that personal details never appear inside the table.
 
+Batches of PDFs can be converted in parallel with :func:`convert_many`
+(``--glob`` on the command line), which keeps one Docling converter
+alive per worker process.
+
 Note: The post-processing aims to be conservative and only affects the
 header area and the first table's spurious header-like rows. The main
 tables are otherwise left intact.
@@ -26,17 +30,86 @@ tables are otherwise left intact.
 
 from __future__ import annotations
 
+import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from glob import glob
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
+from docling.datamodel import layout_model_specs
 from docling.datamodel.base_models import InputFormat
+from docling.datamodel.layout_model_specs import LayoutModelType
 from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     TableFormerMode,
 )
 from docling.document_converter import DocumentConverter, PdfFormatOption
 
+_log = logging.getLogger(__name__)
+
+# Canonical order of the fields in the rewritten header section
+_HEADER_ORDER = (
+    "Name",
+    "Designation",
+    "EmpNo",
+    "PAN",
+    "UAN",
+    "PF No.",
+    "E.S.I. No.",  # may remain missing
+    "Date of Joining",
+    "Payable Days",
+    "Bank Name",
+    "Bank Account",
+    "IFS Code",
+    "Location",
+)
+
+# Header identifiers
+_PAN_RE = re.compile(r"\b[A-Z]{5}[A-Z0-9]{4}[A-Z]\b")
+_UAN_RE = re.compile(r"\b\d{12}\b")
+_PF_RE = re.compile(r"\b[A-Z]{1,3}/\d+/\d+\b")
+_IFSC_RE = re.compile(r"\b[A-Z]{4}0[A-Z0-9]{6}\b")
+_DATE_RE = re.compile(r"\b\d{2}-\d{2}-\d{4}\b")
+# Typed tokens of the joining-details line
+_JOIN_TOKENS_RE = re.compile(
+    rf"(?P<date>{_DATE_RE.pattern})"
+    rf"|(?P<ifsc>{_IFSC_RE.pattern})"
+    r"|(?P<long>\b\d{10,}\b)"  # bank account typically >= 10 digits
+    r"|(?P<small>\b\d{1,3}\b)"
+)
+
+# End of the pre-table header block: first markdown table row or heading
+_HEADER_CUT_RE = re.compile(r"\n(?:\| |## |# )")
+
+# Name / EmpNo heuristics
+_NAME_LINE_RE = re.compile(r"[A-Z][a-zA-Z]+(?: [A-Z][a-zA-Z]+){1,2}")
+_EMPNO_LINE_RE = re.compile(r"\d{4,8}")
+
+# Filename hints
+_EMPNO_FILENAME_RE = re.compile(r"\d{4,}")
+_ALPHA_RE = re.compile(r"[A-Za-z]+")
+_NAME2_RE = re.compile(r"[A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+")
+
+# A run of consecutive Markdown table lines
+_TABLE_BLOCK_RE = re.compile(r"(?m)^(?:[ \t]*\|.*(?:\r?\n|$))+")
+
+# Lowercase header labels whose presence marks a spurious row in the first table
+_HEADER_TOKENS: frozenset[str] = frozenset(key.lower() for key in _HEADER_ORDER)
+
+
+def _split_header(md_text: str) -> Tuple[str, str]:
+    """Split Markdown into the pre-table header block and the remainder.
+
+    The header block runs up to the first Markdown table row or heading
+    marker; when neither is present the whole text is considered header.
+    """
+    m = _HEADER_CUT_RE.search(md_text)
+    cut_idx = m.start() if m else len(md_text)
+    return md_text[:cut_idx], md_text[cut_idx:]
+
 
 def extract_filename_hints(pdf_path: Path) -> Dict[str, str]:
     """Infer header fields from the input filename when possible.
@@ -58,28 +131,45 @@ def extract_filename_hints(pdf_path: Path) -> Dict[str, str]:
         A dictionary containing optional keys such as "EmpNo" and
         "Name" when these can be reliably inferred from the filename.
     """
+    return dict(_filename_hints_cached(pdf_path.stem))
+
+
+@lru_cache(maxsize=256)
+def _filename_hints_cached(stem: str) -> Tuple[Tuple[str, str], ...]:
+    """Memoized worker for :func:`extract_filename_hints`.
+
+    Returns the hints as a tuple of ``(key, value)`` pairs so that the
+    cached result stays immutable.
+    """
     hints: Dict[str, str] = {}
-    stem = pdf_path.stem
-    parts = stem.split("_")
+    # Peel off only the trailing tokens instead of splitting the whole stem
+    rest, sep_last, last = stem.rpartition("_")
+    rest, sep_prev, prev = rest.rpartition("_")
     # Heuristic for files like: MT_Payslip_6_2024_Mainak_Chhari_527564
-    if len(parts) >= 3:
-        last = parts[-1]
-        prev = parts[-2]
+    if sep_last and sep_prev:  # at least three tokens
         # EmpNo is often the last numeric suffix
-        if re.fullmatch(r"\d{4,}", last or ""):
+        if _EMPNO_FILENAME_RE.fullmatch(last):
             hints["EmpNo"] = last
         # Name may be just before EmpNo; try combining two prior tokens if they look like a name
-        if re.fullmatch(r"[A-Za-z]+", prev or "") and len(parts) >= 4:
-            maybe_name = parts[-3] + " " + parts[-2]
-            if re.fullmatch(r"[A-Z][a-zA-Z]+ [A-Z][a-zA-Z]+", maybe_name):
+        if _ALPHA_RE.fullmatch(prev):
+            _, sep_first, first = rest.rpartition("_")
+            maybe_name = first + " " + prev
+            if sep_first and _NAME2_RE.fullmatch(maybe_name):
                 hints["Name"] = maybe_name
-    return hints
+    return tuple(hints.items())
 
 
-def parse_header_pairs(md_text: str, pdf_path: Path) -> Dict[str, str]:
+def _first_token(
+    tokens: List[re.Match[str]], kind: str, start: int
+) -> Optional[re.Match[str]]:
+    """Return the first join-line token of ``kind`` at or after ``start``."""
+    return next((t for t in tokens if t.lastgroup == kind and t.start() >= start), None)
+
+
+def parse_header_pairs(header_block: str, pdf_path: Path) -> Dict[str, str]:
     """Extract a clean mapping of header key:value pairs from Markdown.
 
-    The function limits itself to the pre-table portion of the Markdown
+    The function operates on the pre-table portion of the Markdown
     output and uses regex heuristics to find values for standard
     payslip fields (e.g., PAN, UAN, PF No., IFS Code, Date of Joining,
     Payable Days, Bank Account, Bank Name, Location). It also applies
@@ -88,8 +178,9 @@ def parse_header_pairs(md_text: str, pdf_path: Path) -> Dict[str, str]:
 
     Parameters
     ----------
-    md_text: str
-        The full Markdown content exported by Docling.
+    header_block: str
+        The pre-table header block of the Markdown exported by Docling,
+        as returned by :func:`_split_header`.
     pdf_path: Path
         Path to the original PDF; used for filename-based hints.
 
@@ -101,38 +192,20 @@ def parse_header_pairs(md_text: str, pdf_path: Path) -> Dict[str, str]:
     """
     header_map: Dict[str, str] = {}
 
-    # Limit parsing to the pre-table header block (before first markdown table or first heading)
-    cut_idx = len(md_text)
-    for marker in ["\n| ", "\n## ", "\n# "]:
-        i = md_text.find(marker)
-        if i != -1:
-            cut_idx = min(cut_idx, i)
-    header_block = md_text[:cut_idx]
     lines = [ln.strip() for ln in header_block.splitlines() if ln.strip()]
 
-    # Regex patterns
-    pan_re = re.compile(r"\b[A-Z]{5}[A-Z0-9]{4}[A-Z]\b")
-    uan_re = re.compile(r"\b\d{12}\b")
-    pf_re = re.compile(r"\b[A-Z]{1,3}/\d+/\d+\b")
-    ifsc_re = re.compile(r"\b[A-Z]{4}0[A-Z0-9]{6}\b")
-    date_re = re.compile(r"\b\d{2}-\d{2}-\d{4}\b")
-    long_digits_re = re.compile(r"\b\d{10,}\b")  # bank account typically >= 10 digits
-
     # Scan entire header block for unique identifiers
-    pan = pan_re.search(header_block)
+    pan = _PAN_RE.search(header_block)
     if pan:
         header_map["PAN"] = pan.group(0)
 
-    # UAN: prefer 12-digit unique
-    uan = None
-    for m in uan_re.finditer(header_block):
-        # Avoid capturing the bank account if 12 digits could appear there; we'll remove later if conflicts
-        uan = m.group(0)
-    if uan:
-        header_map["UAN"] = uan
+    # UAN: prefer 12-digit unique; keep the last one found
+    uans = _UAN_RE.findall(header_block)
+    if uans:
+        header_map["UAN"] = uans[-1]
 
     # PF No.
-    pf = pf_re.search(header_block)
+    pf = _PF_RE.search(header_block)
     if pf:
         header_map["PF No."] = pf.group(0)
 
@@ -140,51 +213,47 @@ def parse_header_pairs(md_text: str, pdf_path: Path) -> Dict[str, str]:
     # Find the line that contains these labels (or just try to parse values from any line with a date and IFSC)
     join_line: Optional[str] = None
     for ln in lines:
-        if date_re.search(ln) and ifsc_re.search(ln):
+        if _DATE_RE.search(ln) and _IFSC_RE.search(ln):
             join_line = ln
             break
     if join_line:
-        date_m = date_re.search(join_line)
+        # Tokenize the line once, then pick the fields from the typed tokens
+        tokens = list(_JOIN_TOKENS_RE.finditer(join_line))
+        date_m = _first_token(tokens, "date", 0)
         if date_m:
             header_map["Date of Joining"] = date_m.group(0)
 
-        # Remaining after date
-        rest = join_line[date_m.end() :] if date_m else join_line
-        # Payable days: first small integer (<= 3 digits)
-        days_m = re.search(r"\b\d{1,3}\b", rest)
+        # Payable days: first small integer (<= 3 digits) after the date
+        pos = date_m.end() if date_m else 0
+        days_m = _first_token(tokens, "small", pos)
         if days_m:
             header_map["Payable Days"] = days_m.group(0)
-            rest2 = rest[days_m.end() :]
-        else:
-            rest2 = rest
+            pos = days_m.end()
 
         # IFSC and account
-        ifsc_m = ifsc_re.search(rest2)
+        ifsc_m = _first_token(tokens, "ifsc", pos)
         acct_m = None
-        for m in long_digits_re.finditer(rest2):
-            # choose the longest digit span before IFSC
-            if ifsc_m and m.start() < ifsc_m.start():
-                if not acct_m or len(m.group(0)) > len(acct_m.group(0)):
-                    acct_m = m
+        if ifsc_m:
+            for m in tokens:
+                # choose the longest digit span before IFSC
+                if m.lastgroup == "long" and pos <= m.start() < ifsc_m.start():
+                    if not acct_m or len(m.group(0)) > len(acct_m.group(0)):
+                        acct_m = m
         if acct_m:
             header_map["Bank Account"] = acct_m.group(0)
         if ifsc_m:
             header_map["IFS Code"] = ifsc_m.group(0)
 
         # Bank Name: text between payable days and account digits
-        bank_name = None
         if days_m and acct_m:
-            between = rest2[days_m.end() : acct_m.start()]
-            bank_name = between.strip()
-            # collapse multiple spaces
-            bank_name = re.sub(r"\s+", " ", bank_name)
-        if bank_name:
-            header_map["Bank Name"] = bank_name
+            # strip and collapse multiple spaces
+            bank_name = " ".join(join_line[days_m.end() : acct_m.start()].split())
+            if bank_name:
+                header_map["Bank Name"] = bank_name
 
         # Location: text after IFSC
         if ifsc_m:
-            after_ifsc = rest2[ifsc_m.end() :].strip()
-            after_ifsc = re.sub(r"\s+", " ", after_ifsc)
+            after_ifsc = " ".join(join_line[ifsc_m.end() :].split())
             if after_ifsc:
                 header_map["Location"] = after_ifsc
 
@@ -206,17 +275,21 @@ def parse_header_pairs(md_text: str, pdf_path: Path) -> Dict[str, str]:
             header_map.setdefault("Designation", ln)
             break
 
+    # Filename hints take precedence over the header text for Name and EmpNo
+    hints = extract_filename_hints(pdf_path)
+    if "Name" in hints:
+        header_map["Name"] = hints["Name"]
+
     # Name: choose a likely person name (Title Case words) not equal to designation
     if "Name" not in header_map:
         for ln in lines:
             if ln == header_map.get("Designation"):
                 continue
-            if re.fullmatch(r"[A-Z][a-zA-Z]+(?: [A-Z][a-zA-Z]+){1,2}", ln):
+            if _NAME_LINE_RE.fullmatch(ln):
                 header_map["Name"] = ln
                 break
 
     # EmpNo: prefer filename hint else choose a small integer not used elsewhere
-    hints = extract_filename_hints(pdf_path)
     if "EmpNo" in hints:
         header_map["EmpNo"] = hints["EmpNo"]
     else:
@@ -226,25 +299,22 @@ def parse_header_pairs(md_text: str, pdf_path: Path) -> Dict[str, str]:
             if v and v.isdigit():
                 used_nums.add(v)
         for ln in lines:
-            m = re.fullmatch(r"\d{4,8}", ln)
+            m = _EMPNO_LINE_RE.fullmatch(ln)
             if m and m.group(0) not in used_nums:
                 header_map["EmpNo"] = m.group(0)
                 break
 
-    # Prefer filename hint for Name if available
-    if "Name" in hints:
-        header_map["Name"] = hints["Name"]
-
     return header_map
 
 
-def rewrite_header(md_text: str, header_map: Dict[str, str]) -> str:
+def rewrite_header(rest: str, header_map: Dict[str, str]) -> str:
     """Replace the original pre-table header with a clean key:value list.
 
     Parameters
     ----------
-    md_text: str
-        The full Markdown content exported by Docling.
+    rest: str
+        The Markdown content following the original header block, as
+        returned by :func:`_split_header`.
     header_map: Dict[str, str]
         The cleaned header mapping produced by :func:`parse_header_pairs`.
 
@@ -255,40 +325,29 @@ def rewrite_header(md_text: str, header_map: Dict[str, str]) -> str:
         top (before any table or heading markers).
     """
     # Build a clean header section
-    order = [
-        "Name",
-        "Designation",
-        "EmpNo",
-        "PAN",
-        "UAN",
-        "PF No.",
-        "E.S.I. No.",  # may remain missing
-        "Date of Joining",
-        "Payable Days",
-        "Bank Name",
-        "Bank Account",
-        "IFS Code",
-        "Location",
-    ]
-    lines = []
-    for key in order:
-        val = header_map.get(key)
-        if val:
-            lines.append(f"**{key}**: {val}")
-
-    clean_header = "\n".join(lines) + "\n\n"
-
-    # Replace the original header block (before first table/heading) with the clean header
-    cut_idx = len(md_text)
-    for marker in ["\n| ", "\n## ", "\n# "]:
-        i = md_text.find(marker)
-        if i != -1:
-            cut_idx = min(cut_idx, i)
-    rest = md_text[cut_idx:]
-    return clean_header + rest
-
-
-def _clean_first_table(md_text: str, header_keys: Dict[str, str]) -> str:
+    get = header_map.get
+    lines = [f"**{key}**: {val}" for key in _HEADER_ORDER if (val := get(key))]
+
+    # The original header block (before first table/heading) is dropped by the caller
+    return "\n".join(lines) + "\n\n" + rest
+
+
+@lru_cache(maxsize=8)
+def _header_token_pattern(tokens: frozenset[str]) -> re.Pattern[str]:
+    """Build an alternation matching any lowercase header key token.
+
+    The pattern is case-sensitive and meant to be run over lowercased
+    text, which is considerably faster than a case-insensitive scan.
+    Longer tokens are tried first so that the alternation prefers the
+    most specific label.
+    """
+    key_tokens = {t.lower() for t in tokens}
+    return re.compile(
+        "|".join(re.escape(t) for t in sorted(key_tokens, key=len, reverse=True))
+    )
+
+
+def _clean_first_table(md_text: str, tokens: frozenset[str] = _HEADER_TOKENS) -> str:
     """Remove spurious header-like rows from the first Markdown table.
 
     Some conversions occasionally merge header labels/values into the
@@ -301,9 +360,9 @@ def _clean_first_table(md_text: str, header_keys: Dict[str, str]) -> str:
     md_text: str
         The full Markdown content exported by Docling, possibly already
         modified by :func:`rewrite_header`.
-    header_keys: Dict[str, str]
-        A dictionary of header field keys to check for (values are
-        ignored). Keys should be canonical names, e.g. "PAN", "UAN".
+    tokens: frozenset[str]
+        Lowercase header labels to check for, e.g. "pan", "uan". Defaults
+        to all header fields written by :func:`rewrite_header`.
 
     Returns
     -------
@@ -311,66 +370,94 @@ def _clean_first_table(md_text: str, header_keys: Dict[str, str]) -> str:
         Markdown text with the first table cleaned of any header-like
         rows.
     """
-    lines = md_text.splitlines(keepends=True)
-
     # find first table block
-    start = None
-    for idx, ln in enumerate(lines):
-        if ln.lstrip().startswith("|"):
-            start = idx
-            break
-    if start is None:
+    table_m = _TABLE_BLOCK_RE.search(md_text)
+    if table_m is None:
         return md_text
 
-    end = start
-    while end < len(lines) and lines[end].lstrip().startswith("|"):
-        end += 1
-
-    table_lines = lines[start:end]
-
-    # Build a set of lowercase keys to detect
-    key_tokens = set(k.lower() for k in header_keys.keys())
-    # Also include combined label string often merged into a row
-    key_tokens.update(
-        [
-            "date of joining",
-            "payable days",
-            "bank name",
-            "bank account",
-            "ifs code",
-            "location",
-        ]
+    table_start, table_end = table_m.span()
+    # Lower the table once and scan it with the case-sensitive token pattern
+    lowered = md_text[table_start:table_end].lower()
+    key_re = _header_token_pattern(tokens)
+    if len(lowered) != table_end - table_start:
+        # Some non-ASCII characters change length when lowered, so offsets in
+        # the lowered copy no longer line up; lower the rows one by one instead.
+        rows = md_text[table_start:table_end].splitlines(keepends=True)
+        kept_rows = [row for row in rows if not key_re.search(row.lower())]
+        if len(kept_rows) == len(rows):
+            return md_text
+        return md_text[:table_start] + "".join(kept_rows) + md_text[table_end:]
+
+    # Fast reject: well-formed tables carry no header token at all, in which
+    # case the table is left untouched without copying the original block.
+    m = key_re.search(lowered)
+    if m is None:
+        return md_text
+
+    block = md_text[table_start:table_end]
+
+    # Keep header row and data rows unless they contain any header key token.
+    # Alignment rows ("| --- | :---: |") never contain a token and are kept.
+    # The table is scanned as a whole rather than row by row: after each hit
+    # the search resumes at the next row, so rows without a token are only
+    # ever visited by the regex engine and each row is matched at most once.
+    kept: list[str] = [md_text[:table_start]]
+    copied = 0  # offset within the table up to which rows were copied
+    while m is not None:
+        row_start = lowered.rfind("\n", 0, m.start()) + 1
+        row_end = lowered.find("\n", m.end()) + 1 or len(lowered)
+        kept.append(block[copied:row_start])
+        copied = row_end
+        m = key_re.search(lowered, row_end)
+
+    kept.append(block[copied:])
+    kept.append(md_text[table_end:])
+    return "".join(kept)
+
+
+@lru_cache(maxsize=4)
+def _get_converter(
+    do_ocr: bool = False,
+    do_tables: bool = True,
+    mode: TableFormerMode = TableFormerMode.ACCURATE,
+    cell_match: bool = True,
+    layout_model: LayoutModelType = LayoutModelType.DOCLING_LAYOUT_V2,
+) -> DocumentConverter:
+    """Return a Docling converter for the given pipeline settings.
+
+    Converters are cached per settings so that the layout and table
+    models are loaded once per process instead of once per PDF. The
+    defaults are the settings used for payslips: table structure in
+    accurate mode, no OCR.
+    """
+    opts = PdfPipelineOptions()
+    opts.do_ocr = do_ocr
+    opts.do_table_structure = do_tables
+    opts.table_structure_options.mode = mode
+    opts.table_structure_options.do_cell_matching = cell_match
+    opts.layout_options.model_spec = getattr(layout_model_specs, layout_model.name)
+
+    return DocumentConverter(
+        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=opts)}
     )
 
-    def is_alignment_row(s: str) -> bool:
-        """Check whether a Markdown table row is an alignment separator.
-
-        Considers rows like "| --- | :---: | ---: |" as alignment rows
-        that should not be removed.
-        """
-        body = s.strip()
-        return body.startswith("|") and set(body.replace("|", "").strip()) <= {
-            "-",
-            ":",
-            " ",
-        }
 
-    filtered: list[str] = []
-    for ln in table_lines:
-        ln_lower = ln.lower()
-        if is_alignment_row(ln):
-            filtered.append(ln)
-            continue
-        # keep header row and data rows unless they contain any header key token
-        if any(tok in ln_lower for tok in key_tokens):
-            continue
-        filtered.append(ln)
-
-    if filtered == table_lines:
-        return md_text
+def _convert_and_fix(
+    converter: DocumentConverter, pdf_path: Path, out_dir: Path
+) -> Path:
+    """Convert ``pdf_path`` with ``converter`` and write the fixed Markdown."""
+    conv_res = converter.convert(pdf_path)
+    md_text = conv_res.document.export_to_markdown()
+
+    header_block, rest = _split_header(md_text)
+    header_map = parse_header_pairs(header_block, pdf_path)
+    fixed_md = rewrite_header(rest, header_map)
+    # Clean spurious header-like rows accidentally merged into the first table
+    fixed_md = _clean_first_table(fixed_md)
 
-    new_text = "".join(lines[:start]) + "".join(filtered) + "".join(lines[end:])
-    return new_text
+    out_path = out_dir / (pdf_path.stem + ".fixed.md")
+    out_path.write_bytes(fixed_md.encode("utf-8"))
+    return out_path
 
 
 def convert_with_fix(pdf_path: Path, out_dir: Path) -> Path:
@@ -395,44 +482,73 @@ def convert_with_fix(pdf_path: Path, out_dir: Path) -> Path:
         The path to the written ``.fixed.md`` file.
     """
     out_dir.mkdir(parents=True, exist_ok=True)
+    return _convert_and_fix(_get_converter(), pdf_path, out_dir)
 
-    opts = PdfPipelineOptions()
-    opts.do_ocr = False
-    opts.do_table_structure = True
-    opts.table_structure_options.mode = TableFormerMode.ACCURATE
-    # Keep default cell matching; header fix operates on markdown, not tables
 
-    converter = DocumentConverter(
-        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=opts)}
-    )
-    conv_res = converter.convert(pdf_path)
-    md_text = conv_res.document.export_to_markdown()
+# Per-process converter used by the ``convert_many`` worker pool
+_worker_converter: Optional[DocumentConverter] = None
 
-    header_map = parse_header_pairs(md_text, pdf_path)
-    fixed_md = rewrite_header(md_text, header_map)
-    # Clean spurious header-like rows accidentally merged into the first table
-    fixed_md = _clean_first_table(
-        fixed_md,
-        {
-            "Name": "",
-            "Designation": "",
-            "EmpNo": "",
-            "PAN": "",
-            "UAN": "",
-            "PF No.": "",
-            "E.S.I. No.": "",
-            "Date of Joining": "",
-            "Payable Days": "",
-            "Bank Name": "",
-            "Bank Account": "",
-            "IFS Code": "",
-            "Location": "",
-        },
-    )
 
-    out_path = out_dir / (pdf_path.stem + ".fixed.md")
-    out_path.write_text(fixed_md)
-    return out_path
+def _init_worker() -> None:
+    """Pool initializer: load the Docling models once per worker process."""
+    global _worker_converter
+    _worker_converter = _get_converter()
+    # DocumentConverter builds its pipeline lazily; load the models up front
+    _worker_converter.initialize_pipeline(InputFormat.PDF)
+
+
+def _worker_convert(pdf_path: Path, out_dir: Path) -> Path:
+    """Pool task: convert a single PDF with the worker's converter."""
+    assert _worker_converter is not None, "worker was not initialized"
+    return _convert_and_fix(_worker_converter, pdf_path, out_dir)
+
+
+def convert_many(
+    pdfs: List[Path], out_dir: Path, workers: Optional[int] = None
+) -> List[Optional[Path]]:
+    """Convert several PDFs in parallel and apply header/table corrections.
+
+    The PDFs are distributed over a pool of worker processes. Each worker
+    builds its own Docling converter once at start-up and reuses it for
+    every file it handles, so the layout and table models are loaded
+    once per worker rather than once per file. A PDF that fails to
+    convert is logged and skipped; it does not abort the other files.
+
+    Parameters
+    ----------
+    pdfs: List[Path]
+        Paths to the input PDFs.
+    out_dir: Path
+        Output directory where the corrected ``.fixed.md`` files will be
+        written. The directory is created if it does not exist.
+    workers: Optional[int]
+        Number of worker processes. Defaults to the number of CPUs, and
+        is never larger than the number of PDFs.
+
+    Returns
+    -------
+    List[Optional[Path]]
+        For each input PDF, in input order, the path to the written
+        ``.fixed.md`` file, or ``None`` if its conversion failed.
+    """
+    if not pdfs:
+        return []
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    results: List[Optional[Path]] = [None] * len(pdfs)
+    workers = min(workers or os.cpu_count() or 1, len(pdfs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {
+            pool.submit(_worker_convert, pdf_path, out_dir): idx
+            for idx, pdf_path in enumerate(pdfs)
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as exc:
+                _log.error("Failed to convert %s: %s", pdfs[idx], exc)
+    return results
 
 
 def main() -> None:
@@ -440,20 +556,54 @@ def main() -> None:
 
     Usage:
         uv run python examples/fix_payslip_header.py INPUT.pdf --out ./.ungit
+        uv run python examples/fix_payslip_header.py --glob "payslips/*.pdf"
     """
     import argparse
 
     parser = argparse.ArgumentParser(
         description="Fix payslip header pairing in Markdown output."
     )
-    parser.add_argument("pdf", type=Path, help="Input PDF path")
+    parser.add_argument(
+        "pdf", type=Path, nargs="?", help="Input PDF path or directory of PDFs"
+    )
+    parser.add_argument(
+        "--glob", help="Glob pattern selecting the input PDFs for batch conversion"
+    )
     parser.add_argument(
         "--out", type=Path, default=Path("./.ungit"), help="Output directory"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch conversion (default: CPU count)",
+    )
     args = parser.parse_args()
 
-    out_path = convert_with_fix(args.pdf, args.out)
-    print(f"Wrote: {out_path}")
+    if args.glob and args.pdf is not None:
+        parser.error("give either an input PDF/directory or --glob, not both")
+    if args.glob:
+        pdfs = sorted(Path(p) for p in glob(args.glob, recursive=True))
+        source = f"glob {args.glob!r}"
+    elif args.pdf is not None and args.pdf.is_dir():
+        pdfs = sorted(args.pdf.glob("*.pdf"))
+        source = f"directory {args.pdf}"
+    elif args.pdf is not None:
+        out_path = convert_with_fix(args.pdf, args.out)
+        print(f"Wrote: {out_path}")
+        return
+    else:
+        parser.error("either an input PDF/directory or --glob is required")
+    if not pdfs:
+        parser.exit(1, f"No PDFs matched {source}\n")
+
+    results = convert_many(pdfs, args.out, workers=args.workers)
+    for out_path in results:
+        if out_path is not None:
+            print(f"Wrote: {out_path}")
+    failed = results.count(None)
+    if failed:
+        parser.exit(1, f"{failed} of {len(pdfs)} PDFs failed to convert\n")
 
 
 if __name__ == "__main__":
@@ -34,7 +34,7 @@ def main() -> None:
     doc = converter.convert(args.pdf).document
 
     out_file = args.out / f"{args.pdf.stem}.md"
-    out_file.write_text(doc.export_to_markdown())
+    out_file.write_bytes(doc.export_to_markdown().encode("utf-8"))
     print(f"Wrote: {out_file}")
 
 
@@ -27,14 +27,16 @@ def main() -> None:
     opts.do_ocr = False
     opts.do_table_structure = False
     opts.layout_options.model_spec = DOCLING_LAYOUT_HERON_101
-    opts.images_scale = 1.0
+    # Markdown only: no page or picture images need to be rendered
+    opts.generate_page_images = False
+    opts.generate_picture_images = False
 
     conv = DocumentConverter(
         format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=opts)}
     )
     doc = conv.convert(args.pdf).document
     out_file = args.out / f"{args.pdf.stem}.no_tables.md"
-    out_file.write_text(doc.export_to_markdown())
+    out_file.write_bytes(doc.export_to_markdown().encode("utf-8"))
     print(f"Wrote: {out_file}")
 
     # 2) If you need tables but header gets scrambled, you can switch: